@@ -3,164 +3,183 @@ Sudoku Solver - GUI Module
 This module provides a graphical user interface for the Sudoku solver.
 """
 import tkinter as tk
-from tkinter import ttk, messagebox
-import time
-import threading
+from tkinter import ttk, messagebox, font as tkfont
+import random
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Tuple, Optional, Callable
 
 from sudoku_solver import SudokuSolver, get_sample_puzzle
 
 
-class SudokuCell(tk.Frame):
-    """
-    A custom widget representing a single Sudoku cell.
-    """
-    def __init__(self, master, row: int, col: int, value: int = 0, 
-                 readonly: bool = False, callback: Callable = None):
-        """
-        Initialize a Sudoku cell.
-        
-        Args:
-            master: The parent widget
-            row: The row index (0-8)
-            col: The column index (0-8)
-            value: The initial value (0 for empty)
-            readonly: Whether the cell is part of the initial puzzle
-            callback: Function to call when the cell is clicked
-        """
-        super().__init__(master, width=60, height=60, 
-                        highlightthickness=1, highlightbackground="#CCCCCC")
-        
-        self.row = row
-        self.col = col
-        self.value = value
-        self.readonly = readonly
-        self.callback = callback
-        self.selected = False
-        
-        # Create the label to display the value
-        self.label = tk.Label(self, text="", font=("Arial", 20), 
-                             width=2, height=1)
-        self.label.pack(expand=True, fill=tk.BOTH)
-        
-        # Set initial value
-        self.set_value(value)
-        
-        # Bind click event
-        self.label.bind("<Button-1>", self._on_click)
-        self.bind("<Button-1>", self._on_click)
-    
-    def _on_click(self, event):
-        """Handle click events on the cell."""
-        if self.callback:
-            self.callback(self.row, self.col)
-    
-    def set_value(self, value: int):
-        """Set the cell's value."""
-        self.value = value
-        
-        if value == 0:
-            self.label.config(text="")
-        else:
-            self.label.config(text=str(value))
-            
-        # Update appearance based on whether it's readonly
-        if self.readonly and value != 0:
-            self.label.config(fg="#000000", font=("Arial", 20, "bold"))
-        else:
-            self.label.config(fg="#0066CC", font=("Arial", 20))
-    
-    def select(self):
-        """Mark the cell as selected."""
-        self.selected = True
-        self.config(highlightthickness=2, highlightbackground="#FF0000")
-    
-    def deselect(self):
-        """Mark the cell as not selected."""
-        self.selected = False
-        self.config(highlightthickness=1, highlightbackground="#CCCCCC")
-    
-    def is_selected(self) -> bool:
-        """Check if the cell is selected."""
-        return self.selected
-    
-    def is_readonly(self) -> bool:
-        """Check if the cell is readonly."""
-        return self.readonly
-    
-    def set_readonly(self, readonly: bool):
-        """Set whether the cell is readonly."""
-        self.readonly = readonly
-        self.set_value(self.value)  # Update appearance
+@lru_cache(maxsize=8)
+def _cached_sample_puzzle(difficulty: str) -> Tuple[Tuple[int, ...], ...]:
+    """Get a sample puzzle, built once per difficulty and shared read-only."""
+    return tuple(map(tuple, get_sample_puzzle(difficulty)))
 
 
-class SudokuBoard(tk.Frame):
+class SudokuBoard(tk.Canvas):
     """
     A widget representing the entire Sudoku board.
+    The grid is drawn on a single canvas: each cell is a rectangle and a
+    text item rather than a widget of its own.
     """
+    CELL_SIZE = 60
+    MARGIN = 5
+    
     def __init__(self, master):
         """Initialize the Sudoku board."""
-        super().__init__(master, bg="#FFFFFF", padx=5, pady=5)
+        size = self.CELL_SIZE * 9 + self.MARGIN * 2
+        super().__init__(master, width=size, height=size, bg="#FFFFFF",
+                         highlightthickness=0)
         
-        self.cells = []
         self.selected_cell = None
         
+        # Named fonts shared by every cell, so Tk resolves them only once
+        self._font_normal = tkfont.Font(self, family="Arial", size=20)
+        self._font_bold = tkfont.Font(self, family="Arial", size=20,
+                                      weight="bold")
+        
+        # Flat row-major cell state, indexed by row * 9 + col
+        self._state = [0] * 81
+        self._readonly = [False] * 81
+        self._highlighted = [False] * 81
+        
+        # Canvas item ids for each cell's text
+        self._text_ids = []
+        
         # Create the grid of cells
-        for i in range(9):
-            row = []
-            for j in range(9):
-                cell = SudokuCell(self, i, j, callback=self._on_cell_click)
-                
-                # Position the cell
-                cell.grid(row=i, column=j, padx=(3 if j % 3 == 0 else 1), 
-                         pady=(3 if i % 3 == 0 else 1))
-                
-                row.append(cell)
-            self.cells.append(row)
+        cs = self.CELL_SIZE
+        for i in range(81):
+            row, col = divmod(i, 9)
+            x = self.MARGIN + col * cs
+            y = self.MARGIN + row * cs
+            self.create_rectangle(x, y, x + cs, y + cs, fill="",
+                                  outline="#CCCCCC", width=1)
+            self._text_ids.append(self.create_text(
+                x + cs // 2, y + cs // 2, text="", fill="#0066CC",
+                font=self._font_normal))
+        
+        # Draw the 3x3 box borders
+        end = self.MARGIN + 9 * cs
+        for k in range(0, 10, 3):
+            pos = self.MARGIN + k * cs
+            self.create_line(self.MARGIN, pos, end, pos, width=3)
+            self.create_line(pos, self.MARGIN, pos, end, width=3)
+        
+        # Selection outline, drawn above the grid and moved between cells
+        self._cursor = self.create_rectangle(0, 0, cs, cs, outline="#FF0000",
+                                             width=2, state=tk.HIDDEN)
+        
+        # Bind mouse events
+        self.bind("<Button-1>", self._on_click)
         
-        # Bind keyboard events
-        self.master.bind("<Key>", self._on_key_press)
+        # Keyboard events go through a bindtag of this board's own on the
+        # parent, so other <Key> handlers there are left alone
+        self._key_tag = f"SudokuBoardKeys{id(self)}"
+        self._key_binding = self.bind_class(self._key_tag, "<Key>",
+                                            self._on_key_press)
+        self.master.bindtags(self.master.bindtags() + (self._key_tag,))
+    
+    def destroy(self):
+        """Remove the keyboard binding from the parent and destroy the board."""
+        self.master.bindtags(tuple(tag for tag in self.master.bindtags()
+                                   if tag != self._key_tag))
+        self.unbind_class(self._key_tag, "<Key>")
+        self.deletecommand(self._key_binding)
+        super().destroy()
+    
+    def _on_click(self, event):
+        """Handle click events by resolving the cell under the pointer."""
+        col = (event.x - self.MARGIN) // self.CELL_SIZE
+        row = (event.y - self.MARGIN) // self.CELL_SIZE
+        if 0 <= row < 9 and 0 <= col < 9:
+            self._on_cell_click(row, col)
     
     def _on_cell_click(self, row: int, col: int):
         """Handle cell click events."""
-        # Deselect the previously selected cell
-        if self.selected_cell:
-            prev_row, prev_col = self.selected_cell
-            self.cells[prev_row][prev_col].deselect()
-        
-        # Select the new cell
-        self.cells[row][col].select()
+        # Move the selection outline onto the new cell
+        x = self.MARGIN + col * self.CELL_SIZE
+        y = self.MARGIN + row * self.CELL_SIZE
+        self.coords(self._cursor, x, y, x + self.CELL_SIZE, y + self.CELL_SIZE)
+        if not self.selected_cell:
+            self.itemconfigure(self._cursor, state=tk.NORMAL)
         self.selected_cell = (row, col)
     
+    def _clear_selection(self):
+        """Deselect the currently selected cell, if any."""
+        if self.selected_cell:
+            self.itemconfigure(self._cursor, state=tk.HIDDEN)
+            self.selected_cell = None
+    
     def _on_key_press(self, event):
         """Handle keyboard events."""
         if not self.selected_cell:
             return
             
         row, col = self.selected_cell
-        cell = self.cells[row][col]
+        index = row * 9 + col
         
         # Ignore input for readonly cells
-        if cell.is_readonly():
+        if self._readonly[index]:
             return
             
         # Handle number keys (1-9)
         if event.char.isdigit() and event.char != '0':
-            cell.set_value(int(event.char))
+            self._set_cell(index, int(event.char), False, False)
         
         # Handle delete/backspace
         elif event.keysym in ('Delete', 'BackSpace'):
-            cell.set_value(0)
+            self._set_cell(index, 0, False, False)
+    
+    def _set_cell(self, index: int, value: int, readonly: bool,
+                  highlight: bool):
+        """
+        Update a cell's state and redraw its text.
+        
+        Args:
+            index: The flat cell index (row * 9 + col)
+            value: The new value (0 for empty)
+            readonly: Whether the cell is part of the initial puzzle
+            highlight: Whether to show the value in the highlight color
+        """
+        self._state[index] = value
+        self._readonly[index] = readonly
+        self._highlighted[index] = highlight
+        
+        # Update appearance based on whether it's readonly
+        if readonly and value != 0:
+            fg, font = "#000000", self._font_bold
+        else:
+            fg, font = "#0066CC", self._font_normal
+        if highlight:
+            fg = "#009900"  # Green color
+        
+        self.itemconfigure(self._text_ids[index],
+                           text=str(value) if value else "", fill=fg, font=font)
+    
+    def set_cell(self, row: int, col: int, value: int, readonly: bool = False,
+                 highlight: bool = False):
+        """
+        Set a single cell.
+        
+        Args:
+            row: The row index (0-8)
+            col: The column index (0-8)
+            value: The new value (0 for empty)
+            readonly: Whether the cell should be readonly
+            highlight: Whether to show the value in the highlight color
+        """
+        self._set_cell(row * 9 + col, value, readonly, highlight)
     
     def get_board(self) -> List[List[int]]:
         """Get the current board state."""
-        board = []
-        for i in range(9):
-            row = []
-            for j in range(9):
-                row.append(self.cells[i][j].value)
-            board.append(row)
-        return board
+        state = self._state
+        return [state[i:i + 9] for i in range(0, 81, 9)]
+    
+    def get_empty_cells(self) -> List[int]:
+        """Get the flat indices (row * 9 + col) of all empty cells."""
+        return [i for i, value in enumerate(self._state) if value == 0]
     
     def set_board(self, board: List[List[int]], readonly_mask: List[List[bool]] = None):
         """
@@ -170,6 +189,7 @@ class SudokuBoard(tk.Frame):
             board: A 9x9 grid of values
             readonly_mask: A 9x9 grid indicating which cells are readonly
         """
+        state = self._state
         for i in range(9):
             for j in range(9):
                 value = board[i][j]
@@ -181,28 +201,26 @@ class SudokuBoard(tk.Frame):
                 elif value != 0:
                     readonly = True
                 
-                # Update the cell
-                self.cells[i][j].set_value(value)
-                self.cells[i][j].set_readonly(readonly)
-        
-        # Clear selection
-        if self.selected_cell:
-            row, col = self.selected_cell
-            self.cells[row][col].deselect()
-            self.selected_cell = None
+                # Only redraw cells whose value or appearance changed
+                index = i * 9 + j
+                if (state[index] == value
+                        and self._readonly[index] == readonly
+                        and not self._highlighted[index]):
+                    continue
+                self._set_cell(index, value, readonly, False)
+        
+        self.update_idletasks()
+        self._clear_selection()
     
     def clear_board(self):
         """Clear the board."""
-        for i in range(9):
-            for j in range(9):
-                self.cells[i][j].set_value(0)
-                self.cells[i][j].set_readonly(False)
+        for index in range(81):
+            if (self._state[index] or self._readonly[index]
+                    or self._highlighted[index]):
+                self._set_cell(index, 0, False, False)
         
-        # Clear selection
-        if self.selected_cell:
-            row, col = self.selected_cell
-            self.cells[row][col].deselect()
-            self.selected_cell = None
+        self.update_idletasks()
+        self._clear_selection()
     
     def highlight_solution(self, original_board: List[List[int]], 
                           solved_board: List[List[int]]):
@@ -215,10 +233,16 @@ class SudokuBoard(tk.Frame):
         """
         for i in range(9):
             for j in range(9):
-                if original_board[i][j] == 0 and solved_board[i][j] != 0:
+                value = solved_board[i][j]
+                if original_board[i][j] == 0 and value != 0:
                     # This is a cell that was filled by the solver
-                    self.cells[i][j].set_value(solved_board[i][j])
-                    self.cells[i][j].label.config(fg="#009900")  # Green color
+                    index = i * 9 + j
+                    if (self._state[index] != value
+                            or not self._highlighted[index]):
+                        self._set_cell(index, value,
+                                       self._readonly[index], True)
+        
+        self.update_idletasks()
 
 
 class SudokuGUI:
@@ -248,6 +272,17 @@ class SudokuGUI:
         # Create the solver
         self.solver = SudokuSolver()
         
+        # Last solution found for a hint, reused while the board agrees with it
+        self._hint_solution = None
+        
+        # Single long-lived worker for solves and generations. Each job
+        # uses its own SudokuSolver, so self.solver is only ever touched
+        # from the Tk thread.
+        self._executor = ThreadPoolExecutor(max_workers=1,
+                                            thread_name_prefix="sudoku-solver")
+        self._closing = False
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
         # Create the main frame
         self.main_frame = ttk.Frame(root, padding=10)
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -339,14 +374,12 @@ class SudokuGUI:
     
     def solve_puzzle(self):
         """Solve the current puzzle."""
-        # Get the current board
-        board = self.board.get_board()
-        
-        # Create a copy of the original board
-        original_board = [row[:] for row in board]
+        # Get the current board. get_board returns a fresh snapshot and
+        # the solver keeps its own copy, so this doubles as the original.
+        original_board = self.board.get_board()
         
         # Set the board in the solver
-        self.solver.set_board(board)
+        self.solver.set_board(original_board)
         
         # Check if the board is valid
         if not self.solver.is_valid_board():
@@ -358,27 +391,30 @@ class SudokuGUI:
         self.status_var.set("Solving puzzle...")
         self.root.update_idletasks()
         
-        # Solve in a separate thread to avoid freezing the UI
-        def solve_thread():
-            # Solve the puzzle
-            start_time = time.time()
-            solved = self.solver.solve()
-            solve_time = time.time() - start_time
-            
-            # Update the UI in the main thread
-            self.root.after(0, lambda: self._handle_solve_result(
-                solved, original_board, solve_time))
+        # Solve on the worker thread to avoid freezing the UI
+        self._submit(self._solve_job, (original_board,),
+                     lambda result: self._handle_solve_result(
+                         result, original_board))
+    
+    @staticmethod
+    def _solve_job(board: List[List[int]]
+                   ) -> Tuple[bool, float, List[List[int]], int]:
+        """
+        Solve a board on the worker thread with a solver of its own.
         
-        threading.Thread(target=solve_thread).start()
+        Returns:
+            A tuple (solved, solve_time, solved_board, steps)
+        """
+        solver = SudokuSolver(board)
+        solved = solver.solve()
+        steps, solve_time = solver.get_solve_metrics()
+        return solved, solve_time, solver.get_board(), steps
     
-    def _handle_solve_result(self, solved: bool, original_board: List[List[int]], 
-                            solve_time: float):
+    def _handle_solve_result(self, result: Tuple[bool, float, List[List[int]], int],
+                            original_board: List[List[int]]):
         """Handle the result of the solve operation."""
+        solved, solve_time, solved_board, steps = result
         if solved:
-            # Get the solved board
-            solved_board = self.solver.get_board()
-            steps, _ = self.solver.get_solve_metrics()
-            
             # Update the board
             self.board.highlight_solution(original_board, solved_board)
             
@@ -400,18 +436,16 @@ class SudokuGUI:
         self.status_var.set(f"Generating {difficulty} puzzle...")
         self.root.update_idletasks()
         
-        # Generate in a separate thread
-        def generate_thread():
-            # Generate the puzzle
-            solved_board = self.solver.generate_puzzle(difficulty)
-            
-            # Get the generated puzzle
-            board = self.solver.get_board()
-            
-            # Update the UI in the main thread
-            self.root.after(0, lambda: self._handle_generate_result(board))
-        
-        threading.Thread(target=generate_thread).start()
+        # Generate on the worker thread
+        self._submit(self._generate_job, (difficulty,),
+                     self._handle_generate_result)
+    
+    @staticmethod
+    def _generate_job(difficulty: str) -> List[List[int]]:
+        """Generate a puzzle on the worker thread and return it."""
+        solver = SudokuSolver()
+        solver.generate_puzzle(difficulty)
+        return solver.get_board()
     
     def _handle_generate_result(self, board: List[List[int]]):
         """Handle the result of the generate operation."""
@@ -422,6 +456,45 @@ class SudokuGUI:
         difficulty = self.difficulty_var.get()
         self.status_var.set(f"Generated a new {difficulty} puzzle.")
     
+    def _submit(self, job: Callable, args: tuple, handler: Callable):
+        """
+        Run a job on the worker thread and pass its result to a handler
+        on the Tk thread.
+        
+        Args:
+            job: The function to run on the worker thread
+            args: Positional arguments for the job
+            handler: Function called on the Tk thread with the job's result
+        """
+        future = self._executor.submit(job, *args)
+        future.add_done_callback(lambda f: self._on_job_done(f, handler))
+    
+    def _on_job_done(self, future: Future, handler: Callable):
+        """Hand a finished job back to the Tk thread (runs on the worker)."""
+        if future.cancelled() or self._closing:
+            return
+        try:
+            self.root.after(0, self._finish_job, future, handler)
+        except (RuntimeError, tk.TclError):
+            # The window was destroyed while the job was finishing
+            pass
+    
+    def _finish_job(self, future: Future, handler: Callable):
+        """Deliver a finished job's result, reporting any error it raised."""
+        try:
+            result = future.result()
+        except Exception as exc:
+            self.status_var.set("Operation failed.")
+            messagebox.showerror("Error", f"The operation failed: {exc}")
+            return
+        handler(result)
+    
+    def _on_close(self):
+        """Stop the worker thread and close the window."""
+        self._closing = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+    
     def clear_board(self):
         """Clear the board."""
         self.board.clear_board()
@@ -457,7 +530,7 @@ class SudokuGUI:
     def load_sample_puzzle(self, difficulty: str):
         """Load a sample puzzle of the specified difficulty."""
         # Get a sample puzzle
-        board = get_sample_puzzle(difficulty)
+        board = _cached_sample_puzzle(difficulty)
         
         # Update the board
         self.board.set_board(board)
@@ -471,44 +544,52 @@ class SudokuGUI:
         board = self.board.get_board()
         
         # Find empty cells
-        empty_cells = []
-        for i in range(9):
-            for j in range(9):
-                if board[i][j] == 0:
-                    empty_cells.append((i, j))
+        empty_cells = self.board.get_empty_cells()
         
         if not empty_cells:
             messagebox.showinfo("Hint", "The board is already complete!")
             return
         
-        # Set the board in the solver
-        self.solver.set_board(board)
-        
-        # Check if the board is valid
-        if not self.solver.is_valid_board():
-            messagebox.showerror("Invalid Puzzle", 
-                               "The current puzzle configuration is invalid.")
-            return
-        
-        # Solve the puzzle
-        if not self.solver.solve():
-            messagebox.showerror("Error", "No solution exists for this puzzle!")
-            return
-        
-        # Get the solved board
-        solved_board = self.solver.get_board()
+        # Reuse the previous solution if every filled cell still agrees
+        # with it; otherwise solve the board from scratch
+        solved_board = self._hint_solution
+        if solved_board is None or not self._agrees_with(board, solved_board):
+            # Set the board in the solver
+            self.solver.set_board(board)
+            
+            # Check if the board is valid
+            if not self.solver.is_valid_board():
+                messagebox.showerror("Invalid Puzzle", 
+                                   "The current puzzle configuration is invalid.")
+                return
+            
+            # Solve the puzzle
+            if not self.solver.solve():
+                messagebox.showerror("Error", "No solution exists for this puzzle!")
+                return
+            
+            # Get the solved board
+            solved_board = self.solver.get_board()
+            self._hint_solution = solved_board
         
         # Choose a random empty cell to fill
-        import random
-        row, col = random.choice(empty_cells)
+        row, col = divmod(random.choice(empty_cells), 9)
         
         # Update the cell
-        self.board.cells[row][col].set_value(solved_board[row][col])
-        self.board.cells[row][col].set_readonly(True)
-        self.board.cells[row][col].label.config(fg="#009900")  # Green color
+        self.board.set_cell(row, col, solved_board[row][col], readonly=True,
+                            highlight=True)
         
         # Update status
         self.status_var.set(f"Hint provided at cell ({row+1}, {col+1}).")
+    
+    @staticmethod
+    def _agrees_with(board: List[List[int]], solution: List[List[int]]) -> bool:
+        """Check if every filled cell of the board matches the solution."""
+        for row, solved_row in zip(board, solution):
+            for value, solved in zip(row, solved_row):
+                if value and value != solved:
+                    return False
+        return True
 
 
 if __name__ == "__main__":
@@ -2,16 +2,37 @@
 Sudoku Solver - Core Logic Module
 This module contains the core logic for solving and generating Sudoku puzzles.
 """
+import os
 import random
-import copy
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple, Optional, Set
 
+# Row, column and 3x3 box of each cell, indexed by row * 9 + col
+ROW_OF = tuple(i // 9 for i in range(81))
+COL_OF = tuple(i % 9 for i in range(81))
+BOX_OF = tuple((i // 27) * 3 + (i % 9) // 3 for i in range(81))
+
+# Bitmask bit for each digit, as used by the row, column and box masks
+BIT = tuple(1 << d for d in range(10))
+
+# Count the set bits of a candidate mask. int.bit_count needs Python 3.10;
+# older versions fall back to a lookup table covering every 10-bit mask.
+if hasattr(int, "bit_count"):
+    popcount = int.bit_count
+else:
+    popcount = bytes(bin(m).count("1") for m in range(1024)).__getitem__
+
 
 class SudokuSolver:
     """
     A class that handles Sudoku puzzle solving and generation.
     Uses backtracking algorithm for solving puzzles.
+    
+    The board attribute is a flat list of 81 cells in row-major order,
+    so cell (row, col) is board[row * 9 + col]. Use get_board and
+    set_board to work with a 9x9 grid.
     """
     
     def __init__(self, board: List[List[int]] = None):
@@ -22,19 +43,75 @@ class SudokuSolver:
             board: A 9x9 grid representing the Sudoku puzzle. 
                   0 represents empty cells.
         """
+        # The board is stored flat, with cell (row, col) at row * 9 + col
         if board:
-            self.board = board
+            self.board = [num for row in board for num in row]
         else:
-            self.board = [[0 for _ in range(9)] for _ in range(9)]
+            self.board = [0] * 81
+        
+        # Bitmasks of the digits used in each row, column and 3x3 box.
+        # Bit n is set when digit n is present.
+        self.row_mask = [0] * 9
+        self.col_mask = [0] * 9
+        self.box_mask = [0] * 9
+        self._init_masks()
         
         # Track solving metrics
         self.steps = 0
         self.start_time = 0
-        self.solve_time = 0
+        self.solve_time = 0  # Elapsed wall-clock seconds
+        self.cpu_time = 0    # CPU seconds used by this process
+    
+    def _init_masks(self) -> None:
+        """
+        Rebuild the row, column and box bitmasks from the current board.
+        """
+        board = self.board
+        row_mask = self.row_mask = [0] * 9
+        col_mask = self.col_mask = [0] * 9
+        box_mask = self.box_mask = [0] * 9
+        
+        for i in range(81):
+            num = board[i]
+            if num != 0:
+                bit = BIT[num]
+                row_mask[ROW_OF[i]] |= bit
+                col_mask[COL_OF[i]] |= bit
+                box_mask[BOX_OF[i]] |= bit
+    
+    def _place(self, index: int, num: int) -> None:
+        """
+        Place a number in an empty cell and record it in the bitmasks.
+        
+        Args:
+            index: The flat cell index (row * 9 + col)
+            num: The number to place (1-9)
+        """
+        bit = BIT[num]
+        self.board[index] = num
+        self.row_mask[ROW_OF[index]] |= bit
+        self.col_mask[COL_OF[index]] |= bit
+        self.box_mask[BOX_OF[index]] |= bit
+    
+    def _unplace(self, index: int, num: int) -> None:
+        """
+        Clear a placed cell and remove its digit from the bitmasks.
+        
+        Args:
+            index: The flat cell index (row * 9 + col)
+            num: The number currently in the cell
+        """
+        bit = BIT[num]
+        self.board[index] = 0
+        self.row_mask[ROW_OF[index]] ^= bit
+        self.col_mask[COL_OF[index]] ^= bit
+        self.box_mask[BOX_OF[index]] ^= bit
     
     def is_valid(self, num: int, pos: Tuple[int, int]) -> bool:
         """
         Check if placing a number at the specified position is valid.
+        The cell's own current value is ignored. This reads the board
+        directly, so it does not depend on the bitmasks being in sync.
         
         Args:
             num: The number to check (1-9)
@@ -44,23 +121,24 @@ class SudokuSolver:
             True if the placement is valid, False otherwise
         """
         row, col = pos
+        board = self.board
         
         # Check row
         for x in range(9):
-            if self.board[row][x] == num and col != x:
+            if board[row * 9 + x] == num and col != x:
                 return False
                 
         # Check column
         for x in range(9):
-            if self.board[x][col] == num and row != x:
+            if board[x * 9 + col] == num and row != x:
                 return False
         
         # Check 3x3 box
-        box_x = col // 3
-        box_y = row // 3
-        for i in range(box_y * 3, box_y * 3 + 3):
-            for j in range(box_x * 3, box_x * 3 + 3):
-                if self.board[i][j] == num and (i, j) != pos:
+        box_row = row - row % 3
+        box_col = col - col % 3
+        for i in range(box_row, box_row + 3):
+            for j in range(box_col, box_col + 3):
+                if board[i * 9 + j] == num and (i, j) != pos:
                     return False
                     
         return True
@@ -72,11 +150,37 @@ class SudokuSolver:
         Returns:
             The position (row, col) of an empty cell, or None if no empty cells exist
         """
-        for i in range(9):
-            for j in range(9):
-                if self.board[i][j] == 0:
-                    return (i, j)
-        return None
+        try:
+            return divmod(self.board.index(0), 9)
+        except ValueError:
+            return None
+    
+    def _find_mrv(self) -> Optional[Tuple[int, int]]:
+        """
+        Find the empty cell with the fewest candidate digits.
+        
+        Returns:
+            A tuple (index, candidates) where index is the flat cell index
+            and candidates is a bitmask of the digits that can be placed
+            there, or None if no empty cells exist
+        """
+        board = self.board
+        row_mask, col_mask, box_mask = (self.row_mask, self.col_mask,
+                                        self.box_mask)
+        best = None
+        best_count = 10
+        for i in range(81):
+            if board[i] == 0:
+                cand = 0x3FE & ~(row_mask[ROW_OF[i]] | col_mask[COL_OF[i]]
+                                 | box_mask[BOX_OF[i]])
+                count = popcount(cand)
+                if count < best_count:
+                    best = (i, cand)
+                    best_count = count
+                    # A cell with zero or one candidate can't be beaten
+                    if count <= 1:
+                        return best
+        return best
     
     def solve(self) -> bool:
         """
@@ -86,11 +190,14 @@ class SudokuSolver:
             True if a solution was found, False otherwise
         """
         self.steps = 0
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
+        start_cpu = time.process_time()
         
+        self._init_masks()
         result = self._solve_backtrack()
         
-        self.solve_time = time.time() - self.start_time
+        self.solve_time = time.perf_counter() - self.start_time
+        self.cpu_time = time.process_time() - start_cpu
         return result
     
     def _solve_backtrack(self) -> bool:
@@ -102,18 +209,33 @@ class SudokuSolver:
         """
         self.steps += 1
         
-        # Find an empty cell
-        empty = self.find_empty()
-        if not empty:
-            return True  # Puzzle is solved
+        # Fill in every forced cell before branching
+        ok, placed = self._propagate()
+        if ok:
+            # Find the most constrained empty cell
+            empty = self._find_mrv()
+            if not empty:
+                return True  # Puzzle is solved
+                
+            index, cand = empty
+            row, col, box = ROW_OF[index], COL_OF[index], BOX_OF[index]
+            board = self.board
+            row_mask, col_mask, box_mask = (self.row_mask, self.col_mask,
+                                            self.box_mask)
             
-        row, col = empty
-        
-        # Try placing digits 1-9
-        for num in range(1, 10):
-            if self.is_valid(num, (row, col)):
-                # Place the number if valid
-                self.board[row][col] = num
+            # Try placing each candidate digit. Placement is inlined here
+            # rather than going through _place/_unplace, as this is the
+            # innermost loop of the search.
+            while cand:
+                # Take the lowest candidate bit; it is valid by construction
+                bit = cand & -cand
+                cand ^= bit
+                
+                # Place the number
+                board[index] = bit.bit_length() - 1
+                row_mask[row] |= bit
+                col_mask[col] |= bit
+                box_mask[box] |= bit
                 
                 # Recursively try to solve the rest
                 if self._solve_backtrack():
@@ -121,11 +243,59 @@ class SudokuSolver:
                     
                 # If we get here, the current placement didn't work
                 # Backtrack by resetting the cell
-                self.board[row][col] = 0
-                
+                board[index] = 0
+                row_mask[row] ^= bit
+                col_mask[col] ^= bit
+                box_mask[box] ^= bit
+        
         # No solution found with current configuration
+        self._undo(placed)
         return False
     
+    def _propagate(self) -> Tuple[bool, List[Tuple[int, int]]]:
+        """
+        Repeatedly fill empty cells that have exactly one candidate
+        (naked singles) until none are left.
+        
+        Returns:
+            A tuple (ok, placed) where ok is False if an empty cell was
+            left without candidates, and placed lists the (index, num)
+            assignments made so they can be undone
+        """
+        board = self.board
+        row_mask, col_mask, box_mask = (self.row_mask, self.col_mask,
+                                        self.box_mask)
+        placed = []
+        progress = True
+        while progress:
+            progress = False
+            for i in range(81):
+                if board[i] == 0:
+                    row, col, box = ROW_OF[i], COL_OF[i], BOX_OF[i]
+                    cand = 0x3FE & ~(row_mask[row] | col_mask[col]
+                                     | box_mask[box])
+                    if cand == 0:
+                        return False, placed
+                    if cand & (cand - 1) == 0:
+                        # Place the single candidate
+                        board[i] = cand.bit_length() - 1
+                        row_mask[row] |= cand
+                        col_mask[col] |= cand
+                        box_mask[box] |= cand
+                        placed.append((i, board[i]))
+                        progress = True
+        return True, placed
+    
+    def _undo(self, placed: List[Tuple[int, int]]) -> None:
+        """
+        Undo assignments made by _propagate, most recent first.
+        
+        Args:
+            placed: The (index, num) assignments to undo
+        """
+        for index, num in reversed(placed):
+            self._unplace(index, num)
+    
     def is_valid_board(self) -> bool:
         """
         Check if the current board configuration is valid.
@@ -133,17 +303,23 @@ class SudokuSolver:
         Returns:
             True if the board is valid, False otherwise
         """
-        # Check each cell
-        for i in range(9):
-            for j in range(9):
-                if self.board[i][j] != 0:
-                    # Temporarily set cell to 0 to check if its value is valid
-                    num = self.board[i][j]
-                    self.board[i][j] = 0
-                    if not self.is_valid(num, (i, j)):
-                        self.board[i][j] = num  # Restore value
-                        return False
-                    self.board[i][j] = num  # Restore value
+        board = self.board
+        row_mask = [0] * 9
+        col_mask = [0] * 9
+        box_mask = [0] * 9
+        
+        # Check each cell against the digits already seen in its row,
+        # column and box
+        for i in range(81):
+            num = board[i]
+            if num != 0:
+                bit = BIT[num]
+                row, col, box = ROW_OF[i], COL_OF[i], BOX_OF[i]
+                if (row_mask[row] | col_mask[col] | box_mask[box]) & bit:
+                    return False
+                row_mask[row] |= bit
+                col_mask[col] |= bit
+                box_mask[box] |= bit
         return True
     
     def count_solutions(self, max_solutions: int = 2) -> int:
@@ -151,6 +327,20 @@ class SudokuSolver:
         Count the number of solutions for the current board.
         Stops counting after max_solutions is reached.
         
+        Args:
+            max_solutions: Maximum number of solutions to count
+            
+        Returns:
+            The number of solutions (up to max_solutions)
+        """
+        self._init_masks()
+        return self._count_solutions(max_solutions)
+    
+    def _count_solutions(self, max_solutions: int = 2) -> int:
+        """
+        Count solutions like count_solutions, trusting the current masks
+        to match the board instead of rebuilding them.
+        
         Args:
             max_solutions: Maximum number of solutions to count
             
@@ -160,63 +350,80 @@ class SudokuSolver:
         solutions = [0]  # Use a list to allow modification in nested function
         
         def backtrack() -> bool:
-            # Find an empty cell
-            empty = self.find_empty()
-            if not empty:
-                solutions[0] += 1
-                return solutions[0] >= max_solutions
-                
-            row, col = empty
-            
-            # Try placing digits 1-9
-            for num in range(1, 10):
-                if self.is_valid(num, (row, col)):
-                    # Place the number if valid
-                    self.board[row][col] = num
+            # Fill in every forced cell before branching
+            ok, placed = self._propagate()
+            done = False
+            if ok:
+                # Find the most constrained empty cell
+                empty = self._find_mrv()
+                if not empty:
+                    solutions[0] += 1
+                    done = solutions[0] >= max_solutions
+                else:
+                    index, cand = empty
+                    row, col, box = ROW_OF[index], COL_OF[index], BOX_OF[index]
+                    board = self.board
+                    row_mask, col_mask, box_mask = (
+                        self.row_mask, self.col_mask, self.box_mask)
                     
-                    # Recursively try to solve the rest
-                    if backtrack():
-                        self.board[row][col] = 0
-                        return True
+                    # Try placing each candidate digit
+                    while cand:
+                        # Take the lowest candidate bit
+                        bit = cand & -cand
+                        cand ^= bit
+                        
+                        # Place the number
+                        board[index] = bit.bit_length() - 1
+                        row_mask[row] |= bit
+                        col_mask[col] |= bit
+                        box_mask[box] |= bit
+                        
+                        # Recursively try to solve the rest
+                        done = backtrack()
                         
-                    # Backtrack
-                    self.board[row][col] = 0
+                        # Backtrack
+                        board[index] = 0
+                        row_mask[row] ^= bit
+                        col_mask[col] ^= bit
+                        box_mask[box] ^= bit
+                        if done:
+                            break
             
-            return False
+            self._undo(placed)
+            return done
         
-        # Create a copy of the board to restore later
-        original_board = copy.deepcopy(self.board)
-        
-        # Count solutions
+        # Count solutions. Every placement is undone on the way back out
+        # of the search, so the board is left exactly as it was.
         backtrack()
         
-        # Restore the original board
-        self.board = original_board
-        
         return solutions[0]
     
-    def generate_puzzle(self, difficulty: str = "medium") -> None:
+    def generate_puzzle(self, difficulty: str = "medium",
+                        symmetric: bool = False) -> None:
         """
         Generate a new Sudoku puzzle with the specified difficulty.
         
         Args:
             difficulty: The difficulty level ("easy", "medium", "hard")
+            symmetric: Whether to remove cells in rotationally symmetric
+                       pairs, which also halves the uniqueness checks
         """
         # Clear the board
-        self.board = [[0 for _ in range(9)] for _ in range(9)]
+        self.board = [0] * 81
         
         # Fill the diagonal 3x3 boxes (these can be filled independently)
         for i in range(0, 9, 3):
             self._fill_box(i, i)
+        self._init_masks()
         
         # Solve the rest of the board
         self._solve_backtrack()
         
         # Create a fully solved board
-        solved_board = copy.deepcopy(self.board)
+        solved_board = self.get_board()
         
         # Remove numbers based on difficulty
-        self._remove_numbers(difficulty)
+        self._remove_numbers(difficulty, symmetric)
         
         return solved_board
     
@@ -228,21 +435,22 @@ class SudokuSolver:
             row: The starting row of the box
             col: The starting column of the box
         """
-        nums = list(range(1, 10))
-        random.shuffle(nums)
+        nums = random.sample(range(1, 10), 9)
         
-        index = 0
+        # Copy three digits into each row of the box
+        base = row * 9 + col
         for i in range(3):
-            for j in range(3):
-                self.board[row + i][col + j] = nums[index]
-                index += 1
+            start = base + i * 9
+            self.board[start:start + 3] = nums[i * 3:i * 3 + 3]
     
-    def _remove_numbers(self, difficulty: str) -> None:
+    def _remove_numbers(self, difficulty: str, symmetric: bool = False) -> None:
         """
         Remove numbers from the solved board to create a puzzle.
         
         Args:
             difficulty: The difficulty level ("easy", "medium", "hard")
+            symmetric: Whether to remove each cell together with its
+                       mirror image through the centre of the board
         """
         # Define difficulty levels
         difficulty_levels = {
@@ -254,32 +462,37 @@ class SudokuSolver:
         # Default to medium if invalid difficulty provided
         cells_to_remove = difficulty_levels.get(difficulty.lower(), 45)
         
-        # Get all cell positions
-        all_cells = [(i, j) for i in range(9) for j in range(9)]
+        # Get all cell indices. In symmetric mode each index stands for
+        # itself and its mirror (80 - index), so only the first half is
+        # needed.
+        all_cells = list(range(41 if symmetric else 81))
         random.shuffle(all_cells)
         
-        # Keep track of the current board
-        current_board = copy.deepcopy(self.board)
-        
-        # Remove cells one by one
+        # Remove cells one by one (or pair by pair)
+        board = self.board
         removed = 0
-        for row, col in all_cells:
+        for index in all_cells:
             if removed >= cells_to_remove:
                 break
-                
-            # Remember the value
-            backup = self.board[row][col]
-            self.board[row][col] = 0
             
-            # Make a copy of the current board
-            board_copy = copy.deepcopy(self.board)
+            group = [index]
+            if symmetric and index != 40:
+                group.append(80 - index)
+                if removed + 2 > cells_to_remove:
+                    continue
+                
+            # Remember the values and clear them from the board and masks
+            backup = [board[i] for i in group]
+            for i, value in zip(group, backup):
+                self._unplace(i, value)
             
             # Check if the board still has a unique solution
-            if self.count_solutions() == 1:
-                removed += 1
+            if self._count_solutions() == 1:
+                removed += len(group)
             else:
-                # If not, restore the value
-                self.board[row][col] = backup
+                # If not, restore the values
+                for i, value in zip(group, backup):
+                    self._place(i, value)
     
     def get_board(self) -> List[List[int]]:
         """
@@ -288,7 +501,8 @@ class SudokuSolver:
         Returns:
             A copy of the current board
         """
-        return copy.deepcopy(self.board)
+        board = self.board
+        return [board[i:i + 9] for i in range(0, 81, 9)]
     
     def set_board(self, board: List[List[int]]) -> None:
         """
@@ -297,7 +511,8 @@ class SudokuSolver:
         Args:
             board: A 9x9 grid representing the Sudoku puzzle
         """
-        self.board = copy.deepcopy(board)
+        self.board = [num for row in board for num in row]
+        self._init_masks()
     
     def get_solve_metrics(self) -> Tuple[int, float]:
         """
@@ -312,18 +527,95 @@ class SudokuSolver:
         """
         Print the current board to the console in a readable format.
         """
+        board = self.board
+        lines = []
         for i in range(9):
             if i % 3 == 0 and i != 0:
-                print("- - - - - - - - - - - -")
-                
-            for j in range(9):
-                if j % 3 == 0 and j != 0:
-                    print(" | ", end="")
-                    
-                if j == 8:
-                    print(self.board[i][j])
-                else:
-                    print(str(self.board[i][j]) + " ", end="")
+                lines.append("- - - - - - - - - - - -")
+            
+            # Three groups of three digits, separated by " | "
+            base = i * 9
+            groups = [" ".join(map(str, board[base + j:base + j + 3]))
+                      for j in range(0, 9, 3)]
+            lines.append("  | ".join(groups))
+        
+        # Write the whole board in one call
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _flatten_puzzle(puzzle: List[List[int]]) -> Optional[bytes]:
+    """
+    Pack a puzzle into 81 bytes for sending to a worker process.
+    
+    Args:
+        puzzle: A 9x9 grid, with 0 for empty cells
+        
+    Returns:
+        The 81 cells in row-major order, or None if the puzzle is not a
+        9x9 grid of numbers from 0 to 9
+    """
+    try:
+        if len(puzzle) != 9 or any(len(row) != 9 for row in puzzle):
+            return None
+        flat = bytes(num for row in puzzle for num in row)
+    except (TypeError, ValueError):
+        return None
+    return flat if max(flat) <= 9 else None
+
+
+def _solve_one(flat: bytes) -> Optional[bytes]:
+    """
+    Solve a single puzzle in a worker process.
+    
+    Args:
+        flat: The 81 cells of the puzzle in row-major order
+        
+    Returns:
+        The 81 cells of the solution, or None if the puzzle is malformed
+        or no solution exists
+    """
+    if len(flat) != 81 or max(flat) > 9:
+        return None
+    
+    solver = SudokuSolver()
+    solver.board = list(flat)
+    solver._init_masks()
+    if not solver.is_valid_board() or not solver.solve():
+        return None
+    return bytes(solver.board)
+
+
+def solve_many(puzzles: List[List[List[int]]],
+               workers: int = None) -> List[Optional[List[List[int]]]]:
+    """
+    Solve several puzzles in parallel across worker processes.
+    
+    Args:
+        puzzles: A list of 9x9 grids, with 0 for empty cells
+        workers: Number of worker processes (defaults to the CPU count)
+        
+    Returns:
+        The solved 9x9 grid for each puzzle, in order, or None for
+        puzzles that are malformed, invalid or have no solution
+    """
+    # Send each puzzle as 81 bytes rather than a pickled list of lists;
+    # malformed puzzles are never sent
+    flats = [_flatten_puzzle(puzzle) for puzzle in puzzles]
+    valid = [flat for flat in flats if flat is not None]
+    if not valid:
+        return [None] * len(flats)
+    
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(valid) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        solved = iter(executor.map(_solve_one, valid, chunksize=chunksize))
+    
+    results = []
+    for flat in flats:
+        result = None if flat is None else next(solved)
+        results.append(None if result is None
+                       else [list(result[i:i + 9]) for i in range(0, 81, 9)])
+    return results
 
 
 def get_sample_puzzle(difficulty: str = "medium") -> List[List[int]]: